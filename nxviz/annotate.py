@@ -8,12 +8,13 @@ import numpy as np
 import pandas as pd
 import networkx as nx
 from matplotlib.cm import ScalarMappable
+from matplotlib.collections import PatchCollection
 from matplotlib.colors import Normalize
 from matplotlib.patches import Patch, Rectangle
 
-from nxviz import encodings, layouts, utils
-from nxviz.geometry import circos_radius, item_theta
-from nxviz.polcart import to_cartesian, to_degrees
+from nxviz import encodings, layouts, plots, utils
+from nxviz.geometry import circos_radius
+from nxviz.polcart import to_cartesian
 
 
 def text_alignment(x: float, y: float):
@@ -47,6 +48,18 @@ def text_alignment(x: float, y: float):
     return ha, va
 
 
+def text_alignments(xs: np.ndarray, ys: np.ndarray):
+    """
+    Vectorized `text_alignment` for arrays of x- and y-axis coordinates.
+
+    :returns: A 2-tuple of string arrays, the horizontal and vertical alignments
+        respectively.
+    """
+    has = np.where(xs == 0, "center", np.where(xs > 0, "left", "right"))
+    vas = np.where(ys == 0, "center", np.where(ys > 0, "bottom", "top"))
+    return has, vas
+
+
 def validate_fontdict(fontdict: Dict):
     """Validate `fontdict` keys."""
     valid_keys = {"family", "size", "stretch", "style", "variant", "weight"}
@@ -65,13 +78,13 @@ def circos_group(
     """Text annotation of node grouping variable on a circos plot."""
     validate_fontdict(fontdict)
     nt = utils.node_table(G)
-    groups = nt.groupby(group_by).apply(lambda df: len(df)).sort_index()
+    groups = nt[group_by].value_counts().sort_index()
     proportions = groups / groups.sum()
     starting_points = proportions.cumsum() - proportions
     if midpoint:
         starting_points += proportions / 2
     angles = starting_points * 360
-    radians = angles.apply(lambda x: x / 360 * 2 * np.pi)
+    radians = angles / 360 * 2 * np.pi
 
     if ax is None:
         ax = plt.gca()
@@ -79,9 +92,9 @@ def circos_group(
     if radius is None:
         radius = circos_radius(len(G)) + radius_offset
 
-    for label, theta in radians.to_dict().items():
-        x, y = to_cartesian(radius, theta)
-        ha, va = text_alignment(x, y)
+    xs, ys = to_cartesian(radius, radians.to_numpy())
+    has, vas = text_alignments(xs, ys)
+    for label, x, y, ha, va in zip(radians.index, xs, ys, has, vas):
         ax.annotate(label, xy=(x, y), ha=ha, va=va, **fontdict)
 
 
@@ -95,14 +108,15 @@ def hive_group(
     """Text annotation of hive plot groups."""
     validate_fontdict(fontdict)
     nt = utils.node_table(G)
-    groups = sorted(nt[group_by].unique())
+    group_sizes = nt[group_by].value_counts().sort_index()
 
     if ax is None:
         ax = plt.gca()
 
-    for grp in groups:
-        theta = item_theta(groups, grp) + offset
-        radius = 2 * (8 + len(nt[nt[group_by] == grp]) + 1)
+    # Equivalent to `item_theta(groups, grp)`, without rescanning the groups.
+    for i, (grp, size) in enumerate(group_sizes.items()):
+        theta = i * 2 * np.pi / len(group_sizes) + offset
+        radius = 2 * (8 + size + 1)
         x, y = to_cartesian(radius, theta)
         ha, va = text_alignment(x, y)
         ax.annotate(grp, xy=(x, y), ha=ha, va=va, **fontdict)
@@ -124,7 +138,7 @@ def arc_group(
     if ax is None:
         ax = plt.gca()
     nt = utils.node_table(G)
-    groups = nt.groupby(group_by).apply(lambda df: len(df)).sort_index()
+    groups = nt[group_by].value_counts().sort_index()
     proportions = groups / groups.sum()
     starting_points = proportions.cumsum() - proportions
     if midpoint:
@@ -153,13 +167,13 @@ def parallel_group(
         ax = plt.gca()
     nt = utils.node_table(G)
     # groups = nt.groupby(group_by).apply(lambda df: len(df)).sort_index()
-    groups = sorted(nt[group_by].unique())
+    groups = np.sort(nt[group_by].unique())
 
     for i, label in enumerate(groups):
         x = i * 4
         y = y_offset
         ax.annotate(label, xy=(x, y), ha=ha, va=va, rotation=rotation, **fontdict)
-    ax.relim()
+    plots.relim(ax)
 
 
 def matrix_group(
@@ -176,7 +190,7 @@ def matrix_group(
     if ax is None:
         ax = plt.gca()
     nt = utils.node_table(G)
-    group_sizes = nt.groupby(group_by).apply(lambda df: len(df))
+    group_sizes = nt[group_by].value_counts().sort_index()
     proportions = group_sizes / group_sizes.sum()
     midpoint = proportions / 2
     starting_positions = proportions.cumsum() - proportions
@@ -216,7 +230,7 @@ def matrix_block(
     Most useful for highlighting the within- vs between-group edges.
     """
     nt = utils.node_table(G)
-    group_sizes = nt.groupby(group_by).apply(lambda df: len(df)) * 2
+    group_sizes = nt[group_by].value_counts().sort_index() * 2
     starting_positions = group_sizes.cumsum() + 1 - group_sizes
 
     colors = pd.Series(["black"] * len(group_sizes), index=group_sizes.index)
@@ -224,21 +238,18 @@ def matrix_block(
         color_data = pd.Series(group_sizes.index, index=group_sizes.index)
         colors = encodings.data_color(color_data, color_data)
     # Generate patches first
-    patches = []
-    for label, position in starting_positions.to_dict().items():
-        xy = (position, position)
-        width = height = group_sizes[label]
-
-        patch = Rectangle(
-            xy, width, height, zorder=20, alpha=alpha, facecolor=colors[label]
-        )
-        patches.append(patch)
+    patches = [
+        Rectangle((position, position), size, size)
+        for position, size in zip(starting_positions, group_sizes)
+    ]
+    blocks = PatchCollection(
+        patches, facecolors=list(colors[group_sizes.index]), alpha=alpha, zorder=20
+    )
 
     if ax is None:
         ax = plt.gca()
-    # Then add patches in.
-    for patch in patches:
-        ax.add_patch(patch)
+    # Then add them in as a single collection.
+    ax.add_collection(blocks)
 
 
 def colormapping(
@@ -271,9 +282,7 @@ def colormapping(
             labels = pd.Series(list(palette.keys()))
         else:
             labels = pd.Series(data.unique())
-        cmap, _ = encodings.data_cmap(labels, palette)
-        cfunc = encodings.color_func(labels, palette)
-        colors = labels.apply(cfunc)
+        colors = encodings.data_color(labels, labels, palette)
         patchlist = []
         for color, label in zip(colors, labels):
             data_key = Patch(color=color, label=label)
@@ -356,39 +365,36 @@ def circos_labels(
         radius_adjustment = 1.02
     radius += radius_offset
 
-    for i, (node, data) in enumerate(nt.iterrows()):
-        theta = item_theta(nodes, node)
-        x, y = to_cartesian(r=radius * radius_adjustment, theta=theta)
-        ha, va = text_alignment(x, y)
-
-        if layout == "numbers":
-            tx, _ = to_cartesian(r=radius, theta=theta)
-            tx *= 1 - np.log(np.cos(theta) * utils.nonzero_sign(np.cos(theta)))
-            tx += utils.nonzero_sign(x)
-
-            ty_numerator = (
-                2
-                * radius
-                * (theta % (utils.nonzero_sign(y) * utils.nonzero_sign(x) * np.pi))
-            )
-            ty_denominator = utils.nonzero_sign(x) * np.pi
-            ty = ty_numerator / ty_denominator
-
-            ax.annotate(
-                text="{} - {}".format(*((i, node) if (x > 0) else (node, i))),
-                xy=(tx, ty),
-                ha=ha,
-                va=va,
-                **fontdict,
-            )
+    # Equivalent to `item_theta(nodes, node)`, `to_cartesian`
+    # and `text_alignment` for every node, in one pass.
+    thetas = np.arange(len(nodes)) * 2 * np.pi / len(nodes)
+    xs, ys = to_cartesian(r=radius * radius_adjustment, theta=thetas)
+    has, vas = text_alignments(xs, ys)
+    if layout == "numbers":
+        sign_x = utils.nonzero_sign(xs)
+        sign_y = utils.nonzero_sign(ys)
+        cos_thetas = np.cos(thetas)
+        sign_cos = utils.nonzero_sign(cos_thetas)
+
+        txs, _ = to_cartesian(r=radius, theta=thetas)
+        txs = txs * (1 - np.log(cos_thetas * sign_cos)) + sign_x
+        tys = 2 * radius * (thetas % (sign_y * sign_x * np.pi)) / (sign_x * np.pi)
+        texts = [
+            "{} - {}".format(*((i, node) if x > 0 else (node, i)))
+            for i, (node, x) in enumerate(zip(nodes, xs))
+        ]
+        for i, (text, tx, ty, x, y, ha, va) in enumerate(
+            zip(texts, txs, tys, xs, ys, has, vas)
+        ):
+            ax.annotate(text=text, xy=(tx, ty), ha=ha, va=va, **fontdict)
             ax.annotate(text=i, xy=(x, y), ha="center", va="center")
 
-        elif layout == "rotate":
-            theta_deg = to_degrees(theta)
-            if -90 <= theta_deg <= 90:
-                rot = theta_deg
-            else:
-                rot = theta_deg - 180
+    elif layout == "rotate":
+        # Equivalent to `to_degrees(theta)` for every node.
+        thetas_deg = np.where(np.abs(thetas) > np.pi, thetas % np.pi, thetas)
+        thetas_deg = thetas_deg / np.pi * 180
+        rots = np.where(np.abs(thetas_deg) <= 90, thetas_deg, thetas_deg - 180)
+        for node, x, y, ha, rot in zip(nodes, xs, ys, has, rots):
             ax.annotate(
                 text=node,
                 xy=(x, y),
@@ -399,8 +405,9 @@ def circos_labels(
                 **fontdict,
             )
 
-        # Standard layout
-        else:
+    # Standard layout
+    else:
+        for node, x, y, ha, va in zip(nodes, xs, ys, has, vas):
             ax.annotate(text=node, xy=(x, y), ha=ha, va=va, **fontdict)
 
 
@@ -191,7 +191,7 @@ def base_cloned(
     - `edge_enc_kwargs`: Keyword arguments to set edge visual encodings.
     - `edge_palette`: Same as node_palette but for edges.
     """
-    pos = node_layout_func(
+    pos, pos_cloned = node_layout_func(
         G,
         group_by=group_by,
         sort_by=sort_by,
@@ -200,17 +200,7 @@ def base_cloned(
         alpha_by=node_alpha_by,
         encodings_kwargs=node_enc_kwargs,
         layout_kwargs=node_layout_kwargs,
-        palette=node_palette,
-    )
-    pos_cloned = node_layout_func(
-        G,
-        group_by=group_by,
-        sort_by=sort_by,
-        color_by=node_color_by,
-        size_by=node_size_by,
-        alpha_by=node_alpha_by,
-        encodings_kwargs=node_enc_kwargs,
-        layout_kwargs=cloned_node_layout_kwargs,
+        cloned_layout_kwargs=cloned_node_layout_kwargs,
         palette=node_palette,
     )
     edge_line_func(
@@ -308,6 +298,18 @@ class BasePlot:
             "the object-oriented API will be dropped entirely."
         )
 
+    def _use_axes(self, ax=None):
+        """Make `ax` the current axes, or start a new figure if it is not given.
+
+        When `ax` is given, `self.fig` is set to `ax.figure`
+        and `plt.sca(ax)` makes it the axes that the plot is drawn on.
+        """
+        if ax is None:
+            self.fig = plt.figure()
+        else:
+            self.fig = ax.figure
+            plt.sca(ax)
+
     def draw():
         """No longer implemented!"""
         pass
@@ -350,38 +352,42 @@ object_to_functional = dict(zip(object_api_names, functional_api_names))
 class ArcPlot(BasePlot):
     """Arc Plot."""
 
-    def __init__(self, G, **kwargs):
+    def __init__(self, G, ax=None, **kwargs):
+        """Draw `G` as an arc plot, on `ax` if given (see `_use_axes`)."""
         super().__init__()
         func_kwargs = {object_to_functional[k]: v for k, v in kwargs.items()}
-        self.fig = plt.figure()
+        self._use_axes(ax)
         self.ax = arc(G, **func_kwargs)
 
 
 class CircosPlot(BasePlot):
     """Circos Plot."""
 
-    def __init__(self, G, **kwargs):
+    def __init__(self, G, ax=None, **kwargs):
+        """Draw `G` as a circos plot, on `ax` if given (see `_use_axes`)."""
         super().__init__()
         func_kwargs = {object_to_functional[k]: v for k, v in kwargs.items()}
-        self.fig = plt.figure()
+        self._use_axes(ax)
         self.ax = circos(G, **func_kwargs)
 
 
 class HivePlot(BasePlot):
     """Hive Plot."""
 
-    def __init__(self, G, **kwargs):
+    def __init__(self, G, ax=None, **kwargs):
+        """Draw `G` as a hive plot, on `ax` if given (see `_use_axes`)."""
         super().__init__()
         func_kwargs = {object_to_functional[k]: v for k, v in kwargs.items()}
-        self.fig = plt.figure()
+        self._use_axes(ax)
         self.ax = hive(G, **func_kwargs)
 
 
 class MatrixPlot(BasePlot):
     """Matrix Plot."""
 
-    def __init__(self, G, **kwargs):
+    def __init__(self, G, ax=None, **kwargs):
+        """Draw `G` as a matrix plot, on `ax` if given (see `_use_axes`)."""
         super().__init__()
         func_kwargs = {object_to_functional[k]: v for k, v in kwargs.items()}
-        self.fig = plt.figure()
+        self._use_axes(ax)
         self.ax = matrix(G, **func_kwargs)
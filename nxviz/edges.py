@@ -5,7 +5,6 @@ In drawing edges, we need to know some pieces of information beforehand.
 Firstly,
 """
 
-from copy import deepcopy
 from functools import partial, update_wrapper
 from typing import Callable, Dict, Hashable, Tuple, Optional, Union, List
 
@@ -13,6 +12,7 @@ import matplotlib.pyplot as plt
 import networkx as nx
 import numpy as np
 import pandas as pd
+from matplotlib.colors import to_rgba, to_rgba_array
 
 from nxviz import encodings, lines
 from nxviz.utils import node_table, edge_table
@@ -46,15 +46,23 @@ def edge_colors(
     node_color_by: Hashable,
     palette: Optional[Union[Dict, List]] = None,
 ):
-    """Default edge line color function."""
+    """Default edge line color function.
+
+    Returns an (E, 4) RGBA array;
+    without `color_by`, it is a read-only broadcast of the default color.
+    """
     if color_by in ("source_node_color", "target_node_color"):
         edge_select_by = color_by.split("_")[0]
-        return encodings.data_color(
-            et[edge_select_by].apply(nt[node_color_by].get), nt[node_color_by], palette
+        return to_rgba_array(
+            encodings.data_color(
+                et[edge_select_by].apply(nt[node_color_by].get),
+                nt[node_color_by],
+                palette,
+            )
         )
     elif color_by:
-        return encodings.data_color(et[color_by], et[color_by], palette)
-    return pd.Series(["black"] * len(et), name="color_by")
+        return to_rgba_array(encodings.data_color(et[color_by], et[color_by], palette))
+    return np.broadcast_to(to_rgba("black"), (len(et), 4))
 
 
 def validate_color_by(
@@ -132,7 +140,7 @@ def draw(
         to 1.0 opacity (i.e. opaque.)
 
     Everything else passed in here will be passed
-    to the matplotlib Patch constructor;
+    to the matplotlib PathCollection constructor;
     see `nxviz.lines` for more information.
     """
     nt = node_table(G)
@@ -141,7 +149,7 @@ def draw(
         ax = plt.gca()
     validate_color_by(G, color_by, node_color_by)
     edge_color = edge_colors(et, nt, color_by, node_color_by, palette)
-    encodings_kwargs = deepcopy(encodings_kwargs)
+    encodings_kwargs = dict(encodings_kwargs)
     lw = line_width(et, lw_by) * encodings_kwargs.pop("lw_scale", 1.0)
 
     alpha_bounds = encodings_kwargs.pop("alpha_bounds", None)
@@ -151,7 +159,7 @@ def draw(
 
     aes_kw = {"facecolor": "none"}
     aes_kw.update(encodings_kwargs)
-    patches = lines_func(
+    collection = lines_func(
         et,
         pos,
         edge_color=edge_color,
@@ -160,8 +168,7 @@ def draw(
         aes_kw=aes_kw,
         **linefunc_kwargs,
     )
-    for patch in patches:
-        ax.add_patch(patch)
+    ax.add_collection(collection)
 
 
 circos = partial(draw, lines_func=lines.circos)
@@ -72,6 +72,24 @@ def divergent_color_func(val, cmap, data: pd.Series):
     return cmap(norm(val))
 
 
+def discrete_color_map(
+    cmap, data: pd.Series, palette: Optional[Union[Dict, List]] = None
+) -> Dict:
+    """Return a dictionary mapping each value in `data` to its color.
+
+    ## Parameters
+
+    - `cmap`: A Matplotlib cmap
+    - `data`: Pandas series.
+    - `palette`: Optional custom palette, as a list or dictionary of colors.
+    """
+    if palette is not None:
+        if isinstance(palette, dict):
+            return palette
+        return dict(zip(data.unique(), cycle(palette)))
+    return dict(zip(sorted(data.unique()), cmap.colors))
+
+
 def discrete_color_func(
     val, cmap, data: pd.Series, palette: Optional[Union[Dict, List]] = None
 ):
@@ -83,15 +101,7 @@ def discrete_color_func(
     - `cmap`: A Matplotlib cmap
     - `data`: Pandas series.
     """
-    if palette is not None:
-        if isinstance(palette, dict):
-            return palette[val]
-        else:
-            pal = dict(zip(data.unique(), cycle(palette)))
-            return pal[val]
-    else:
-        colors = sorted(data.unique())
-        return cmap.colors[colors.index(val)]
+    return discrete_color_map(cmap, data, palette)[val]
 
 
 def ordinal_color_func(val, cmap, data):
@@ -146,19 +156,30 @@ def data_color(
         can interpret. If a dictionary is provided, key and record corresponds to
         category and colour respectively.
     """
-    cfunc = color_func(ref_data, palette)
-    return data.apply(cfunc)
+    cmap, data_family = data_cmap(ref_data, palette)
+    if data_family in ["continuous", "ordinal"]:
+        # Colormaps are vectorized, so all values are mapped in one call.
+        rgba = continuous_color_func(data.to_numpy(dtype=float), cmap, ref_data)
+        return pd.Series(list(map(tuple, rgba)), index=data.index, name=data.name)
+
+    color_map = discrete_color_map(cmap, ref_data, palette)
+    # Each distinct value is mapped to a color once,
+    # and the colors are then broadcast back onto `data`.
+    uniques = data.unique()
+    colors = pd.Series([color_map[val] for val in uniques], dtype=object)
+    codes = pd.Index(uniques).get_indexer(data)
+    return pd.Series(colors.to_numpy()[codes], index=data.index, name=data.name)
 
 
 def data_transparency(data: pd.Series, ref_data: pd.Series) -> pd.Series:
     """Transparency based on value."""
     norm = Normalize(vmin=ref_data.min(), vmax=ref_data.max())
-    return data.apply(norm)
+    return pd.Series(norm(data.to_numpy(dtype=float)), index=data.index, name=data.name)
 
 
 def data_size(data: pd.Series, ref_data: pd.Series) -> pd.Series:
     """Square root node size."""
-    return data.apply(np.sqrt)
+    return np.sqrt(data)
 
 
 def data_linewidth(data: pd.Series, ref_data: pd.Series) -> pd.Series:
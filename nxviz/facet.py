@@ -10,23 +10,35 @@ The faceting functions rely on the high level API for plotting.
 import warnings
 from functools import partial, update_wrapper
 from itertools import combinations
-from typing import Callable, Hashable
+from math import isqrt
+from typing import Callable, Dict, Hashable, List
 
 import matplotlib.pyplot as plt
 import networkx as nx
-import numpy as np
 
 from nxviz import annotate, api, utils
 
 
 ### Iterators to generate subgraphs.
+def group_nodes(G: nx.Graph, group_by: Hashable) -> Dict[Hashable, List]:
+    """Return a mapping of each node group to the list of nodes in it.
+
+    Node attributes are read in a single pass over the graph,
+    so that callers need not look up `G.nodes[n][group_by]` per node.
+    """
+    by_group = dict()
+    for node, group in G.nodes(data=group_by):
+        by_group.setdefault(group, []).append(node)
+    return by_group
+
+
 def hive_triplets(G: nx.Graph, group_by: Hashable):
     """Yield subgraphs containing triplets of node categories.
 
     Intended for hive plotting.
     """
-    nt = utils.node_table(G)
-    groups = sorted(nt[group_by].unique())
+    by_group = group_nodes(G, group_by)
+    groups = sorted(by_group)
     if len(groups) > 6:
         warnings.warn(
             "You have more than 6 groups of nodes, "
@@ -37,43 +49,37 @@ def hive_triplets(G: nx.Graph, group_by: Hashable):
         )
     triplets = combinations(groups, 3)
 
-    for groups in triplets:
-        wanted_nodes = (n for n in G.nodes() if G.nodes[n][group_by] in groups)
-        yield G.subgraph(wanted_nodes), groups
+    for triplet in triplets:
+        wanted_nodes = [node for group in triplet for node in by_group[group]]
+        yield G.subgraph(wanted_nodes), triplet
 
 
 def edge_group(G: nx.Graph, group_by: Hashable):
     """Yield graphs containing only certain categories of edges."""
     et = utils.edge_table(G)
-    groups = sorted(et[group_by].unique())
-    for group in groups:
-        G_sub = G.copy()
-        G_sub.remove_edges_from(G_sub.edges())
-        for u, v, d in G.edges(data=True):
-            if d[group_by] == group:
-                G_sub.add_edge(u, v, **d)
+    for group, df in et.groupby(group_by, sort=True):
+        G_sub = nx.create_empty_copy(G)
+        G_sub.add_edges_from(
+            (u, v, G.edges[u, v]) for u, v in zip(df["source"], df["target"])
+        )
         yield G_sub, group
 
 
 def node_group_edges(G: nx.Graph, group_by: Hashable):
     """Return a subgraph containing edges connected to a particular category of nodes."""
-    nt = utils.node_table(G)
-    groups = sorted(nt[group_by].unique())
-
-    for group in groups:
-        G_sub = G.copy()
-        G_sub.remove_edges_from(G_sub.edges())
+    by_group = group_nodes(G, group_by)
 
-        wanted_nodes = (n for n in G.nodes() if G.nodes[n][group_by] == group)
-        for node in wanted_nodes:
-            for u, v, d in G.edges(node, data=True):
-                G_sub.add_edge(u, v, **d)
+    for group in sorted(by_group):
+        G_sub = nx.create_empty_copy(G)
+        G_sub.add_edges_from(G.edges(by_group[group], data=True))
         yield G_sub, group
 
 
 def n_rows_cols(groups):
     """Return squarest n_rows and n_cols combination."""
-    nrows = ncols = int(np.ceil(np.sqrt(len(groups))))
+    n = len(groups)
+    # Integer ceil(sqrt(n)), without a round trip through floats.
+    nrows = ncols = isqrt(n - 1) + 1 if n else 0
     return nrows, ncols
 
 
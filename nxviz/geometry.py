@@ -3,6 +3,7 @@ Utility geometry functions that can help with drawing to screen.
 """
 
 import numpy as np
+from matplotlib.path import Path
 
 from .polcart import to_cartesian
 from typing import List, Hashable
@@ -16,10 +17,13 @@ def item_theta(itemlist: List[Hashable], item: Hashable):
     :param item: The item of interest. Must be in the itemlist.
     :returns: theta -- the angle of the item in radians.
     """
-    assert len(itemlist) > 0, "itemlist must be a list of items."
-    assert item in itemlist, "item must be inside itemlist."
-
-    i = itemlist.index(item)
+    if len(itemlist) == 0:
+        raise ValueError("itemlist must be a list of items.")
+    # `index` already scans for the item, so no separate membership check is needed.
+    try:
+        i = itemlist.index(item)
+    except ValueError:
+        raise ValueError("item must be inside itemlist.") from None
     theta = i * 2 * np.pi / len(itemlist)
 
     return theta
@@ -67,13 +71,30 @@ def circos_radius(n_nodes: int, node_radius: float = 1.0):
 
 
 def correct_hive_angles(start, end):
-    """Perform correction of hive plot angles for edge drawing."""
-    if start > np.pi and end == 0.0:
-        end = 2 * np.pi
-    if start < np.pi and end == 0.0:
-        start, end = end, start
-    if end < np.pi and start == 2 * np.pi:
-        start = 0
-    if end > np.pi and start == 0:
-        start = 2 * np.pi
+    """Perform correction of hive plot angles for edge drawing.
+
+    Works elementwise on arrays of start and end angles.
+    """
+    end = np.where((start > np.pi) & (end == 0.0), 2 * np.pi, end)
+    swap = (start < np.pi) & (end == 0.0)
+    start, end = np.where(swap, end, start), np.where(swap, start, end)
+    start = np.where((end < np.pi) & (start == 2 * np.pi), 0, start)
+    start = np.where((end > np.pi) & (start == 0), 2 * np.pi, start)
     return start, end
+
+
+def circles(xy: np.ndarray, radius) -> List[Path]:
+    """
+    Returns circular paths in data coordinates.
+
+    Each circle is the unit circle scaled by its radius
+    and centred on its (x, y) coordinate.
+
+    :param xy: An (N, 2) array of circle centres.
+    :param radius: The radius of each circle, or one radius for all of them.
+    :returns: A list of N paths.
+    """
+    unit_circle = Path.unit_circle()
+    radius = np.broadcast_to(np.asarray(radius, dtype=float), len(xy))
+    vertices = unit_circle.vertices * radius[:, None, None] + xy[:, None, :]
+    return [Path(v, unit_circle.codes) for v in vertices]
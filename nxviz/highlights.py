@@ -9,7 +9,6 @@ import matplotlib.pyplot as plt
 from functools import partial, update_wrapper
 import numpy as np
 import pandas as pd
-from copy import deepcopy
 
 import networkx as nx
 
@@ -94,7 +93,7 @@ def edge(
     et = utils.edge_table(G).query("source == @source").query("target == @target")
     pos = layout_func(nt, group_by=group_by, sort_by=sort_by)
 
-    line_func_kwargs = deepcopy(line_func_kwargs)
+    line_func_kwargs = dict(line_func_kwargs)
     line_func_kwargs.update(
         et=et,
         pos=pos,
@@ -110,10 +109,8 @@ def edge(
         )
         line_func_kwargs["pos_cloned"] = pos_cloned
 
-    patches = line_func(**line_func_kwargs)
     ax = plt.gca()
-    for patch in patches:
-        ax.add_patch(patch)
+    ax.add_collection(line_func(**line_func_kwargs))
 
 
 circos_edge = partial(
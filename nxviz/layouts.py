@@ -10,7 +10,7 @@ from typing import Dict, Hashable
 import numpy as np
 import pandas as pd
 
-from nxviz.geometry import circos_radius, item_theta
+from nxviz.geometry import circos_radius
 from nxviz.polcart import to_cartesian
 from nxviz.utils import group_and_sort
 
@@ -24,8 +24,9 @@ def parallel(
     for x, (grp, data) in enumerate(nt.groupby(group_by)):
         if sort_by is not None:
             data = data.sort_values(sort_by)
-        for y, (node, d) in enumerate(data.iterrows()):
-            pos[node] = np.array([x * 4, y])
+        xs = np.full(len(data), x * 4)
+        ys = np.arange(len(data))
+        pos.update(zip(data.index, np.column_stack([xs, ys])))
     return pos
 
 
@@ -36,21 +37,14 @@ def circos(
     radius: float = None,
 ) -> Dict[Hashable, np.ndarray]:
     """Circos plot node layout."""
-    pos = dict()
     nt = group_and_sort(nt, group_by, sort_by)
     nodes = list(nt.index)
     if radius is None:
         radius = circos_radius(len(nodes))
-    if group_by:
-        for grp, df in nt.groupby(group_by):
-            for node, data in df.iterrows():
-                x, y = to_cartesian(r=radius, theta=item_theta(nodes, node))
-                pos[node] = np.array([x, y])
-    else:
-        for node, data in nt.iterrows():
-            x, y = to_cartesian(r=radius, theta=item_theta(nodes, node))
-            pos[node] = np.array([x, y])
-    return pos
+    # Equivalent to `item_theta(nodes, node)` for every node, in one pass.
+    theta = np.arange(len(nodes)) * 2 * np.pi / len(nodes)
+    x, y = to_cartesian(r=radius, theta=theta)
+    return dict(zip(nodes, np.column_stack([x, y])))
 
 
 def hive(
@@ -67,38 +61,36 @@ def hive(
     - `inner_radius`: The inner
     """
     nt = group_and_sort(nt, group_by=group_by, sort_by=sort_by)
-    groups = sorted(nt[group_by].unique())
+    codes, groups = pd.factorize(nt[group_by], sort=True)
     if len(groups) > 3:
         raise ValueError(
             f"group_by {group_by} is associated with more than 3 groups. "
-            f"The groups are {groups}. "
+            f"The groups are {list(groups)}. "
             "Hive plots can only handle at most 3 groups at a time."
         )
-    pos = dict()
-    for grp, df in nt.groupby(group_by):
-        for i, (node, data) in enumerate(df.iterrows()):
-            radius = inner_radius + i
-            theta = item_theta(groups, grp) + rotation
-            x, y = to_cartesian(r=radius * 2, theta=theta)
-            pos[node] = np.array([x, y])
-    return pos
+    # Rows are sorted by group, so `codes` is non-decreasing
+    # and a node's rank along its axis is its row position
+    # minus the row position of the first node in its group.
+    rank = np.arange(len(codes)) - np.searchsorted(codes, codes)
+    radius = inner_radius + rank
+    # Equivalent to `item_theta(groups, grp)` for every node's group.
+    theta = codes * 2 * np.pi / len(groups) + rotation
+    x, y = to_cartesian(r=radius * 2, theta=theta)
+    return dict(zip(nt.index, np.column_stack([x, y])))
 
 
 def arc(nt, group_by: Hashable = None, sort_by: Hashable = None):
     """Arc plot node layout."""
     nt = group_and_sort(nt, group_by=group_by, sort_by=sort_by)
-    pos = dict()
-    for x, (node, data) in enumerate(nt.iterrows()):
-        pos[node] = np.array([x * 2, 0])
-    return pos
+    xs = np.arange(len(nt)) * 2
+    ys = np.zeros(len(nt), dtype=int)
+    return dict(zip(nt.index, np.column_stack([xs, ys])))
 
 
 def geo(nt, group_by=None, sort_by=None, longitude="longitude", latitude="latitude"):
     """Geographical node layout."""
-    pos = dict()
-    for node, data in nt.iterrows():
-        pos[node] = data[[longitude, latitude]]
-    return pos
+    xy = nt[[longitude, latitude]].to_numpy()
+    return dict(zip(nt.index, xy))
 
 
 def matrix(nt, group_by: Hashable = None, sort_by: Hashable = None, axis="x"):
@@ -106,15 +98,9 @@ def matrix(nt, group_by: Hashable = None, sort_by: Hashable = None, axis="x"):
     # Nodes should be grouped and sorted before we begin assigning coordinates.
     nt = group_and_sort(node_table=nt, group_by=group_by, sort_by=sort_by)
 
-    # We are eventually going to return this pos dictionary.
-    pos = dict()
-
-    # Loop over each of the rows, and assign x, y coordinates in order of them being grouped and sorted.
-    for i, (node, data) in enumerate(nt.iterrows()):
-        x = (i + 1) * 2
-        y = 0
-
-        if axis == "y":
-            x, y = y, x
-        pos[node] = np.array([x, y])
-    return pos
+    # Assign coordinates in the order that the nodes were grouped and sorted.
+    xs = (np.arange(len(nt)) + 1) * 2
+    ys = np.zeros(len(nt), dtype=int)
+    if axis == "y":
+        xs, ys = ys, xs
+    return dict(zip(nt.index, np.column_stack([xs, ys])))
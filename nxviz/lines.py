@@ -1,14 +1,84 @@
-"""Patch generators for edges."""
+"""Collection generators for edges.
 
-from itertools import product
-from typing import Dict, Iterable, List
+Each function in here returns a single matplotlib Collection
+holding one path per edge,
+to be added to an axes object with `ax.add_collection()`.
+"""
+
+from typing import Dict, Hashable, Iterable, Tuple
 
 import numpy as np
 import pandas as pd
-from matplotlib.patches import Arc, Circle, Patch, Path, PathPatch
+from matplotlib.collections import PathCollection
+from matplotlib.colors import to_rgba_array
+from matplotlib.path import Path
+
+from nxviz.geometry import circles, correct_hive_angles
+from nxviz.polcart import to_cartesian
+from nxviz.utils import align
+
+
+def polar_positions(xy: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the polar (r, theta) coordinates of an (N, 2) array of positions.
+
+    Equivalent to `to_polar(x, y)` for each position, in one vectorized pass.
+    """
+    x, y = xy.T
+    r = np.sqrt(x**2 + y**2)
+    theta = np.arctan2(y, x)
+    return r, np.where(theta < 0, theta + 2 * np.pi, theta)
+
+
+def node_positions(pos: Dict, nodes: Iterable[Hashable]) -> np.ndarray:
+    """Return an (N, 2) array of the positions of `nodes` in `pos`."""
+    index = pd.Index(list(pos), tupleize_cols=False).get_indexer(list(nodes))
+    if (index < 0).any():
+        missing = [n for n, i in zip(nodes, index) if i < 0]
+        raise KeyError(f"Nodes {missing} have no position.")
+    xy = np.array(list(pos.values()), dtype=float).reshape(-1, 2)
+    return xy[index]
+
+
+def edge_rgba(edge_color: Iterable, alpha: Iterable) -> np.ndarray:
+    """Return an (N, 4) RGBA array of `edge_color` with `alpha` as alpha channel."""
+    alpha = np.asarray(alpha, dtype=float)
+    rgba = to_rgba_array(edge_color)
+    rgba = np.array(np.broadcast_to(rgba, (max(len(rgba), alpha.size), 4)))
+    rgba[:, 3] = alpha
+    return rgba
+
+
+def fade_edgecolors(aes_kw: Dict, alpha: Iterable) -> Dict:
+    """Return a copy of `aes_kw` with `alpha` applied to any edgecolor in it."""
+    kw = dict(aes_kw)
+    for key in ("edgecolor", "edgecolors", "ec"):
+        color = kw.get(key)
+        if color is None or (isinstance(color, str) and color in ("face", "none")):
+            continue
+        kw[key] = edge_rgba(color, alpha)
+    return kw
+
+
+def edge_collection(
+    paths: Iterable[Path],
+    edge_color: Iterable,
+    alpha: Iterable,
+    lw: Iterable,
+    aes_kw: Dict,
+) -> PathCollection:
+    """Return unfilled edge paths styled as one collection.
 
-from nxviz.geometry import correct_hive_angles
-from nxviz.polcart import to_cartesian, to_polar, to_radians
+    `edge_color`, `alpha` and `lw` are matched to `paths` by position.
+    """
+    kw = {
+        "facecolors": "none",
+        "edgecolors": edge_rgba(edge_color, alpha),
+        "linewidths": np.asarray(lw, dtype=float),
+        # Patches join line segments with mitres, collections default to round.
+        "joinstyle": "miter",
+    }
+    kw.update(fade_edgecolors(aes_kw, alpha))
+    return PathCollection(list(paths), **kw)
 
 
 def circos(
@@ -18,18 +88,19 @@ def circos(
     alpha: Iterable,
     lw: Iterable,
     aes_kw: Dict,
-) -> List[Patch]:
-    """Circos plot line drawing."""
-    patches = []
-    for r, d in et.iterrows():
-        verts = [pos[d["source"]], (0, 0), pos[d["target"]]]
-        codes = [Path.MOVETO, Path.CURVE3, Path.CURVE3]
-        path = Path(verts, codes)
-        patch = PathPatch(
-            path, edgecolor=edge_color[r], alpha=alpha[r], lw=lw[r], **aes_kw
-        )
-        patches.append(patch)
-    return patches
+) -> PathCollection:
+    """Circos plot line drawing.
+
+    Each edge is a quadratic Bezier curve
+    from its source to its target, with the origin as control point.
+    """
+    edge_color, alpha, lw = (align(v, et.index) for v in (edge_color, alpha, lw))
+    start = node_positions(pos, et["source"])
+    end = node_positions(pos, et["target"])
+    verts = np.stack([start, np.zeros_like(start), end], axis=1)
+    codes = np.array([Path.MOVETO, Path.CURVE3, Path.CURVE3], dtype=Path.code_type)
+    paths = [Path(v, codes) for v in verts]
+    return edge_collection(paths, edge_color, alpha, lw, aes_kw)
 
 
 def line(
@@ -39,20 +110,15 @@ def line(
     alpha: Iterable,
     lw: Iterable,
     aes_kw: Dict,
-):
+) -> PathCollection:
     """Straight line drawing function."""
-    patches = []
-    for r, d in et.iterrows():
-        start = d["source"]
-        end = d["target"]
-        verts = [pos[start], pos[end]]
-        codes = [Path.MOVETO, Path.LINETO]
-        path = Path(verts, codes)
-        patch = PathPatch(
-            path, edgecolor=edge_color[r], alpha=alpha[r], lw=lw[r], **aes_kw
-        )
-        patches.append(patch)
-    return patches
+    edge_color, alpha, lw = (align(v, et.index) for v in (edge_color, alpha, lw))
+    start = node_positions(pos, et["source"])
+    end = node_positions(pos, et["target"])
+    verts = np.stack([start, end], axis=1)
+    codes = np.array([Path.MOVETO, Path.LINETO], dtype=Path.code_type)
+    paths = [Path(v, codes) for v in verts]
+    return edge_collection(paths, edge_color, alpha, lw, aes_kw)
 
 
 def arc(
@@ -62,42 +128,39 @@ def arc(
     alpha: Iterable,
     lw: Iterable,
     aes_kw: Dict,
-):
-    """Arc plot edge drawing function."""
-    patches = []
-    for r, d in et.iterrows():
-        start = d["source"]
-        end = d["target"]
-        start_x, start_y = pos[start]
-        end_x, end_y = pos[end]
-
-        middle_x = np.mean([start_x, end_x])
-        middle_y = np.mean([start_y, end_y])
-
-        width = abs(end_x - start_x)
-        height = width
-
-        r1, theta1 = to_polar(start_x - middle_x, start_y - middle_y)
-        r2, theta2 = to_polar(end_x - middle_x, end_y - middle_y)
-
-        theta1 = np.rad2deg(theta1)
-        theta2 = np.rad2deg(theta2)
-
-        theta1, theta2 = min([theta1, theta2]), max([theta1, theta2])
-
-        patch = Arc(
-            xy=(middle_x, middle_y),
-            width=width,
-            height=height,
-            theta1=theta1,
-            theta2=theta2,
-            edgecolor=edge_color[r],
-            alpha=alpha[r],
-            lw=lw[r],
-            **aes_kw,
-        )
-        patches.append(patch)
-    return patches
+) -> PathCollection:
+    """Arc plot edge drawing function.
+
+    Each edge is a circular arc centred on the midpoint of its nodes,
+    passing through both of them.
+    """
+    edge_color, alpha, lw = (align(v, et.index) for v in (edge_color, alpha, lw))
+    start = node_positions(pos, et["source"])
+    end = node_positions(pos, et["target"])
+    middle = (start + end) / 2
+    radius = np.abs(end[:, 0] - start[:, 0]) / 2
+
+    # Angles of the two nodes as seen from the arc's centre, in degrees.
+    theta = np.arctan2(
+        np.stack([start[:, 1], end[:, 1]]) - middle[:, 1],
+        np.stack([start[:, 0], end[:, 0]]) - middle[:, 0],
+    )
+    theta = np.rad2deg(np.where(theta < 0, theta + 2 * np.pi, theta))
+    theta1, theta2 = theta.min(axis=0), theta.max(axis=0)
+
+    # Arcs on a common baseline all span the same angles,
+    # so each distinct unit arc is only computed once,
+    # then scaled and shifted onto all of its edges in one broadcast.
+    paths = [None] * len(et)
+    angles = np.column_stack([theta1, theta2])
+    unique_angles, which = np.unique(angles, axis=0, return_inverse=True)
+    for k, (t1, t2) in enumerate(unique_angles):
+        idx = np.flatnonzero(which.ravel() == k)
+        unit_arc = Path.arc(t1, t2)
+        verts = unit_arc.vertices * radius[idx, None, None] + middle[idx, None, :]
+        for i, v in zip(idx, verts):
+            paths[i] = Path(v, unit_arc.codes)
+    return edge_collection(paths, edge_color, alpha, lw, aes_kw)
 
 
 def hive(
@@ -109,74 +172,65 @@ def hive(
     lw: Iterable,
     aes_kw: Dict,
     curves: bool = True,
-):
+) -> PathCollection:
     """Hive plot line drawing function."""
-    rad = pd.Series(pos).apply(lambda val: to_polar(*val)).to_dict()
+    edge_color, alpha, lw = (align(v, et.index) for v in (edge_color, alpha, lw))
     if pos_cloned is None:
         pos_cloned = pos
-    rad_cloned = pd.Series(pos_cloned).apply(lambda val: to_polar(*val)).to_dict()
-
-    patches = []
-    for r, d in et.iterrows():
-        start = d["source"]
-        end = d["target"]
-        start_radius, start_theta = rad[start]
-        end_radius, end_theta = rad[end]
-
-        _, start_theta_cloned = rad_cloned[start]
-        _, end_theta_cloned = rad_cloned[end]
-
-        # Find the pair of start and end thetas that give the smallest acute angle
-        smallest_pair = None
-        smallest_nonzero_angle = np.inf
-        starts = [start_theta, start_theta_cloned]
-        ends = [end_theta, end_theta_cloned]
-
-        for start, end in product(starts, ends):
-            start, end = correct_hive_angles(start, end)
-            if not np.allclose(end - start, 0):
-                angle = to_radians(abs(min([end - start, start - end])))
-                if angle < smallest_nonzero_angle:
-                    smallest_nonzero_angle = abs(angle)
-                    smallest_pair = ((start_radius, start), (end_radius, end))
-
-        if smallest_pair is None:
-            continue
+    start_radius, start_theta = polar_positions(node_positions(pos, et["source"]))
+    end_radius, end_theta = polar_positions(node_positions(pos, et["target"]))
+    _, start_theta_cloned = polar_positions(node_positions(pos_cloned, et["source"]))
+    _, end_theta_cloned = polar_positions(node_positions(pos_cloned, et["target"]))
 
-        (start_radius, start_theta), (end_radius, end_theta) = smallest_pair
-        if np.allclose(end_theta, 0):
-            end_theta = 2 * np.pi
-        startx, starty = to_cartesian(start_radius, start_theta)
-        endx, endy = to_cartesian(end_radius, end_theta)
+    if curves:
+        codes = [Path.MOVETO, Path.CURVE4, Path.CURVE4, Path.CURVE4]
+    else:
+        codes = [Path.MOVETO, Path.LINETO]
+    codes = np.array(codes, dtype=Path.code_type)
 
-        middle_theta = np.mean([start_theta, end_theta])
+    # Each edge can join either copy of its start and end axes.
+    # The four candidate pairs of angles are laid out as columns,
+    # in the same order as `product(starts, ends)`.
+    starts = np.column_stack(
+        [start_theta, start_theta, start_theta_cloned, start_theta_cloned]
+    )
+    ends = np.column_stack([end_theta, end_theta_cloned, end_theta, end_theta_cloned])
+    starts, ends = correct_hive_angles(starts, ends)
 
-        middlex1, middley1 = to_cartesian(start_radius, middle_theta)
-        middlex2, middley2 = to_cartesian(end_radius, middle_theta)
-        endx, endy = to_cartesian(end_radius, end_theta)
+    # Find the pair of start and end thetas that give the smallest acute angle.
+    # Pairs that land on the same axis are never drawn,
+    # and edges without any other pair are skipped.
+    nonzero = ~np.isclose(ends - starts, 0)
+    angles = np.where(nonzero, np.abs(ends - starts), np.inf)
+    drawn = np.flatnonzero(nonzero.any(axis=1))
+    smallest = np.argmin(angles, axis=1)[drawn]
 
-        verts = [(startx, starty), (endx, endy)]
-        codes = [Path.MOVETO, Path.LINETO]
-        if curves:
-            verts = [
-                (startx, starty),
-                (middlex1, middley1),
-                (middlex2, middley2),
-                (endx, endy),
-            ]
-            codes = [
-                Path.MOVETO,
-                Path.CURVE4,
-                Path.CURVE4,
-                Path.CURVE4,
-            ]
-
-        path = Path(verts, codes)
-        patch = PathPatch(
-            path, lw=lw[r], alpha=alpha[r], edgecolor=edge_color[r], **aes_kw
-        )
-        patches.append(patch)
-    return patches
+    start_radius = start_radius[drawn]
+    end_radius = end_radius[drawn]
+    start_theta = starts[drawn, smallest]
+    end_theta = ends[drawn, smallest]
+    end_theta = np.where(np.isclose(end_theta, 0), 2 * np.pi, end_theta)
+    middle_theta = (start_theta + end_theta) / 2
+    points = [(start_radius, start_theta), (end_radius, end_theta)]
+    if curves:
+        points = [
+            (start_radius, start_theta),
+            (start_radius, middle_theta),
+            (end_radius, middle_theta),
+            (end_radius, end_theta),
+        ]
+    verts = np.stack([np.column_stack(to_cartesian(r, t)) for r, t in points], axis=1)
+    paths = [Path(v, codes) for v in verts]
+
+    # Edges without a drawable pair of axes are skipped,
+    # so only the aesthetics of the drawn edges are kept.
+    return edge_collection(
+        paths,
+        to_rgba_array(edge_color)[drawn],
+        np.asarray(alpha, dtype=float)[drawn],
+        np.asarray(lw, dtype=float)[drawn],
+        aes_kw,
+    )
 
 
 def matrix(
@@ -187,23 +241,22 @@ def matrix(
     alpha: Iterable,
     lw: Iterable,
     aes_kw: Dict,
-):
-    """Matrix plot edge drawing function."""
-    patches = []
-    for r, d in et.iterrows():
-        start = d["source"]
-        end = d["target"]
-        x_start, y_start = pos_cloned[start]
-        x_end, y_end = pos[end]
-
-        x, y = (max(x_start, y_start), max(x_end, y_end))
-        kw = {
-            "fc": edge_color[r],
-            "alpha": alpha[r],
-            "radius": lw[r],
-            "zorder": 1,
-        }
-        kw.update(aes_kw)
-        patch = Circle(xy=(x, y), **kw)
-        patches.append(patch)
-    return patches
+) -> PathCollection:
+    """Matrix plot edge drawing function.
+
+    Each edge is a filled circle at the cell
+    where its source's row meets its target's column.
+    """
+    edge_color, alpha, lw = (align(v, et.index) for v in (edge_color, alpha, lw))
+    start = node_positions(pos_cloned, et["source"])
+    end = node_positions(pos, et["target"])
+    xy = np.column_stack([start.max(axis=1), end.max(axis=1)])
+    kw = {
+        "facecolors": edge_rgba(edge_color, alpha),
+        "zorder": 1,
+    }
+    kw.update(fade_edgecolors(aes_kw, alpha))
+    # Matrix edges are filled circles,
+    # so the `facecolor="none"` that edges.draw sets for lines does not apply.
+    kw.pop("facecolor", None)
+    return PathCollection(circles(xy, np.asarray(lw, dtype=float)), **kw)
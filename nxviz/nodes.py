@@ -1,6 +1,5 @@
 """Node drawing functions."""
 
-from copy import deepcopy
 from functools import partial, update_wrapper
 from typing import Callable, Dict, Hashable, Optional, Tuple, Union, List
 
@@ -8,20 +7,25 @@ import matplotlib.pyplot as plt
 import networkx as nx
 import numpy as np
 import pandas as pd
-from matplotlib.patches import Circle
+from matplotlib.collections import PathCollection
+from matplotlib.colors import to_rgba, to_rgba_array
 
 from nxviz import encodings, layouts
-from nxviz.utils import node_table
+from nxviz.geometry import circles
+from nxviz.lines import fade_edgecolors
+from nxviz.utils import align, node_table
 from nxviz.plots import rescale, rescale_arc, rescale_square
 
 
 def node_colors(
     nt: pd.DataFrame, color_by: Hashable, palette: Optional[Union[Dict, List]] = None
 ):
-    """Return pandas Series of node colors."""
+    """Return an (N, 4) array of RGBA node colors.
+
+    Without `color_by`, this is a read-only broadcast of the default color."""
     if color_by:
-        return encodings.data_color(nt[color_by], nt[color_by], palette)
-    return pd.Series(["blue"] * len(nt), name="color_by", index=nt.index)
+        return to_rgba_array(encodings.data_color(nt[color_by], nt[color_by], palette))
+    return np.broadcast_to(to_rgba("blue"), (len(nt), 4))
 
 
 def transparency(
@@ -36,25 +40,65 @@ def transparency(
             ref_data = pd.Series(alpha_bounds)
 
         return encodings.data_transparency(nt[alpha_by], ref_data)
-    return pd.Series([1.0] * len(nt), name="transparency", index=nt.index)
+    return pd.Series(1.0, name="transparency", index=nt.index)
 
 
 def node_size(nt: pd.DataFrame, size_by: Hashable):
     """Return pandas Series of node sizes."""
     if size_by:
         return encodings.data_size(nt[size_by], nt[size_by])
-    return pd.Series([1.0] * len(nt), name="size", index=nt.index)
+    return pd.Series(1.0, name="size", index=nt.index)
 
 
-def node_glyphs(nt, pos, node_color, alpha, size, **encodings_kwargs):
-    """Draw circos glyphs to the matplotlib axes object."""
-    patches = dict()
-    for r, d in nt.iterrows():
-        kw = {"fc": node_color[r], "alpha": alpha[r], "radius": size[r], "zorder": 2}
-        kw.update(encodings_kwargs)
-        c = Circle(xy=pos[r], **kw)
-        patches[r] = c
-    return pd.Series(patches)
+def node_aesthetics(
+    nt: pd.DataFrame,
+    color_by: Hashable,
+    alpha_by: Hashable,
+    size_by: Hashable,
+    palette: Optional[Union[Dict, List]] = None,
+    alpha_bounds: Optional[Tuple] = None,
+    alpha_scale: float = 1,
+    size_scale: float = 1,
+) -> Dict[str, Union[np.ndarray, float]]:
+    """Return a dict of scaled node colors, transparencies and sizes.
+
+    Unset encodings are scalars; the others are arrays aligned with `nt`."""
+    aes = {
+        "color": node_colors(nt, color_by, palette),
+        "alpha": alpha_scale,
+        "size": size_scale,
+    }
+    if alpha_by is not None:
+        alpha = transparency(nt, alpha_by, alpha_bounds)
+        aes["alpha"] = alpha.to_numpy() * alpha_scale
+    if size_by is not None:
+        aes["size"] = node_size(nt, size_by).to_numpy() * size_scale
+    return aes
+
+
+def node_glyphs(nt, pos, node_color, alpha, size, pos_cloned=None, **encodings_kwargs):
+    """Return a PathCollection of circular node glyphs, one per visible node.
+
+    Series aesthetics are matched to `nt` by label, others by position.
+    With `pos_cloned`, every node also gets a glyph at its cloned position.
+    """
+    node_color, alpha, size = (align(v, nt.index) for v in (node_color, alpha, size))
+    positions = [pos] if pos_cloned is None else [pos, pos_cloned]
+    xy = np.array(
+        [p[node] for p in positions for node in nt.index], dtype=float
+    ).reshape(-1, 2)
+    # Sizes, colors and alphas are repeated for every set of positions,
+    # so a clone picks up the styling of its original node.
+    radius = np.broadcast_to(np.asarray(size, dtype=float), len(nt))
+    radius = np.tile(radius, len(positions))
+    facecolors = np.tile(to_rgba_array(node_color), (len(positions), 1))
+    facecolors[:, 3] = np.tile(
+        np.broadcast_to(np.asarray(alpha, dtype=float), len(nt)), len(positions)
+    )
+    visible = radius > 0
+    kw = {"facecolors": facecolors[visible], "zorder": 2}
+    kw.update(fade_edgecolors(encodings_kwargs, facecolors[visible, 3]))
+    return PathCollection(circles(xy[visible], radius[visible]), **kw)
 
 
 def draw(
@@ -70,6 +114,7 @@ def draw(
     rescale_func=rescale,
     ax=None,
     palette: Optional[Union[Dict, List]] = None,
+    cloned_layout_kwargs: Optional[Dict] = None,
 ):
     """Draw nodes to matplotlib axes.
 
@@ -90,6 +135,10 @@ def draw(
         in a list/dictionary. Colours must be values `matplotlib.colors.ListedColormap`
         can interpret. If a dictionary is provided, key and record corresponds to
         category and colour respectively.
+    - `cloned_layout_kwargs`: Keyword arguments to pass to the layout function
+        to lay out a clone of every node, as in cloned hive and matrix plots.
+        The clones are drawn in the same collection as the original nodes.
+        If set, a `(pos, pos_cloned)` tuple is returned instead of `pos`.
 
     Special keyword arguments for `encodings_kwargs` include:
 
@@ -107,26 +156,42 @@ def draw(
         to 1.0 opacity (i.e. opaque.)
 
     Everything else passed in here will be passed
-    to the matplotlib Patch constructor;
+    to the matplotlib PathCollection constructor;
     see `nxviz.lines` for more information.
     """
     if ax is None:
         ax = plt.gca()
     nt = node_table(G)
     pos = layout_func(nt, group_by, sort_by, **layout_kwargs)
-    node_color = node_colors(nt, color_by, palette)
 
-    encodings_kwargs = deepcopy(encodings_kwargs)
-    alpha_bounds = encodings_kwargs.pop("alpha_bounds", None)
-    alpha = transparency(nt, alpha_by, alpha_bounds) * encodings_kwargs.pop(
-        "alpha_scale", 1
+    encodings_kwargs = dict(encodings_kwargs)
+    aes = node_aesthetics(
+        nt,
+        color_by,
+        alpha_by,
+        size_by,
+        palette=palette,
+        alpha_bounds=encodings_kwargs.pop("alpha_bounds", None),
+        alpha_scale=encodings_kwargs.pop("alpha_scale", 1),
+        size_scale=encodings_kwargs.pop("size_scale", 1),
+    )
+    pos_cloned = None
+    if cloned_layout_kwargs is not None:
+        pos_cloned = layout_func(nt, group_by, sort_by, **cloned_layout_kwargs)
+    glyphs = node_glyphs(
+        nt,
+        pos,
+        aes["color"],
+        aes["alpha"],
+        aes["size"],
+        pos_cloned=pos_cloned,
+        **encodings_kwargs,
     )
-    size = node_size(nt, size_by) * encodings_kwargs.pop("size_scale", 1)
-    patches = node_glyphs(nt, pos, node_color, alpha, size, **encodings_kwargs)
-    for patch in patches:
-        ax.add_patch(patch)
+    ax.add_collection(glyphs)
 
     rescale_func(G)
+    if pos_cloned is not None:
+        return pos, pos_cloned
     return pos
 
 
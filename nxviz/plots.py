@@ -40,17 +40,30 @@ def aspect_equal(ax=None):
 # They all accept a graph, so that data-dependent xlim and ylims
 
 
+def relim(ax=None):
+    """Recompute the data limits of a matplotlib axes object.
+
+    `Axes.relim()` only accounts for lines, patches and images,
+    so the limits of collections (e.g. node glyphs) are added back in here.
+    """
+    if ax is None:
+        ax = plt.gca()
+    ax.relim()
+    for collection in ax.collections:
+        ax.update_datalim(collection.get_datalim(ax.transData))
+
+
 def rescale(G: nx.Graph):
     """Default rescale."""
     ax = plt.gca()
-    ax.relim()
+    relim(ax)
     ax.autoscale_view()
 
 
 def rescale_arc(G: nx.Graph):
     """Axes rescale function for arc plot."""
     ax = plt.gca()
-    ax.relim()
+    relim(ax)
     ymin, ymax = ax.get_ylim()
     maxheight = int(len(G)) + 1
     ax.set_ylim(ymin - 1, maxheight)
@@ -2,6 +2,7 @@
 
 from collections import Counter
 
+import numpy as np
 import pandas as pd
 import warnings
 from typing import Iterable
@@ -97,7 +98,7 @@ def infer_data_family(data: pd.Series):
             return "divergent"
         return "continuous"
     if data.dtype == int:
-        if len(set(data)) > 9:
+        if data.nunique() > 9:
             return "continuous"
         return "ordinal"
     return "categorical"
@@ -181,12 +182,8 @@ def node_table(G, group_by=None, sort_by=None):
     A pandas DataFrame, such that the index is the node
     and the columns are node attributes.
     """
-    node_table = []
-    node_index = []
-    for n, d in G.nodes(data=True):
-        node_table.append(d)
-        node_index.append(n)
-    df = pd.DataFrame(data=node_table, index=node_index)
+    nodes = dict(G.nodes(data=True))
+    df = pd.DataFrame(data=list(nodes.values()), index=list(nodes))
     df = group_and_sort(df, group_by, sort_by)
     return df
 
@@ -218,9 +215,21 @@ def edge_table(G) -> pd.DataFrame:
             row["source"] = u
             row["target"] = v
             data.append(row)
+    if not data:
+        return pd.DataFrame(columns=["source", "target"])
     return pd.DataFrame(data)
 
 
+def align(values, index: pd.Index):
+    """Match `values` to `index` by label if it is a pandas Series.
+
+    Anything else is returned as is, to be matched by position.
+    """
+    if isinstance(values, pd.Series):
+        return values.reindex(index)
+    return values
+
+
 from typing import Hashable, Iterable
 
 
@@ -241,5 +250,8 @@ def group_and_sort(
 def nonzero_sign(xy):
     """
     A sign function that won't return 0
+
+    Works elementwise on arrays; scalars give back a plain int.
     """
-    return -1 if xy < 0 else 1
+    sign = np.where(np.asarray(xy) < 0, -1, 1)
+    return sign if sign.ndim else int(sign)
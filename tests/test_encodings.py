@@ -64,6 +64,10 @@ def test_data_color(data):
     """Test data_color."""
     colors = aes.data_color(data, data)
     assert isinstance(colors, pd.Series)
+    assert colors.index.equals(data.index)
+    # Equal values must map to equal colors.
+    for _, group in colors.groupby(data):
+        assert len(set(group)) == 1
 
 
 @pytest.mark.parametrize(
@@ -92,3 +96,13 @@ def test_data_linewidth(data):
     lw = aes.data_linewidth(data, data)
     assert isinstance(lw, pd.Series)
     assert np.allclose(lw, data)
+
+
+@pytest.mark.parametrize("palette", [None, ["red", "blue"], {"a": "red", "b": "blue"}])
+def test_discrete_color_map(palette):
+    """Test that discrete_color_map agrees with discrete_color_func."""
+    data = pd.Series(list("abba"))
+    cmap, _ = aes.data_cmap(data, palette)
+    color_map = aes.discrete_color_map(cmap, data, palette)
+    for val in data.unique():
+        assert color_map[val] == aes.discrete_color_func(val, cmap, data, palette)
@@ -0,0 +1,76 @@
+"""Tests for faceting subgraph generators."""
+
+from math import comb
+
+import networkx as nx
+import pytest
+
+from nxviz import facet
+
+
+@pytest.mark.usefixtures("manygroupG")
+def test_edge_group(manygroupG):
+    """Test that edge_group yields one subgraph per edge category.
+
+    Checks:
+
+    1. Every subgraph keeps all of the nodes.
+    2. Every subgraph only contains edges of its category.
+    3. Together, the subgraphs contain every edge exactly once.
+    """
+    n_edges = 0
+    for G_sub, group in facet.edge_group(manygroupG, "edge_group"):
+        assert set(G_sub.nodes()) == set(manygroupG.nodes())
+        for u, v, d in G_sub.edges(data=True):
+            assert d["edge_group"] == group
+            assert d == manygroupG.edges[u, v]
+        n_edges += len(G_sub.edges())
+    assert n_edges == len(manygroupG.edges())
+
+
+@pytest.mark.usefixtures("dummyG")
+def test_node_group_edges(dummyG):
+    """Test that node_group_edges keeps only edges touching a node group."""
+    for G_sub, group in facet.node_group_edges(dummyG, "group"):
+        assert set(G_sub.nodes()) == set(dummyG.nodes())
+        for u, v in G_sub.edges():
+            assert group in (dummyG.nodes[u]["group"], dummyG.nodes[v]["group"])
+        expected = [
+            (u, v)
+            for u, v in dummyG.edges()
+            if group in (dummyG.nodes[u]["group"], dummyG.nodes[v]["group"])
+        ]
+        assert len(G_sub.edges()) == len(expected)
+
+
+@pytest.mark.usefixtures("manygroupG")
+def test_hive_triplets(manygroupG):
+    """Test that hive_triplets yields subgraphs of exactly three node groups."""
+    n_groups = len(set(nx.get_node_attributes(manygroupG, "group").values()))
+    n_triplets = 0
+    with pytest.warns(UserWarning):
+        for G_sub, groups in facet.hive_triplets(manygroupG, "group"):
+            assert len(groups) == 3
+            expected = {
+                n for n, d in manygroupG.nodes(data=True) if d["group"] in groups
+            }
+            assert set(G_sub.nodes()) == expected
+            n_triplets += 1
+    assert n_triplets == comb(n_groups, 3)
+
+
+@pytest.mark.parametrize(
+    "n_groups, expected", [(0, 0), (1, 1), (2, 2), (4, 2), (5, 3), (9, 3), (10, 4)]
+)
+def test_n_rows_cols(n_groups, expected):
+    """Test that n_rows_cols returns the squarest grid that fits all groups."""
+    assert facet.n_rows_cols(range(n_groups)) == (expected, expected)
+
+
+@pytest.mark.usefixtures("dummyG")
+def test_group_nodes(dummyG):
+    """Test that group_nodes places every node under its own group."""
+    by_group = facet.group_nodes(dummyG, "group")
+    assert sum(len(nodes) for nodes in by_group.values()) == len(dummyG)
+    for group, nodes in by_group.items():
+        assert all(dummyG.nodes[n]["group"] == group for n in nodes)
@@ -1,13 +1,16 @@
 """Tests for geometry module."""
 
 import numpy as np
+import pytest
 from random import choice
 
 import nxviz.polcart as polcart
 from hypothesis import assume, given, settings
 from hypothesis.strategies import floats, integers, lists
 from nxviz.geometry import (
+    circles,
     circos_radius,
+    correct_hive_angles,
     correct_negative_angle,
     get_cartesian,
     item_theta,
@@ -45,6 +48,15 @@ def test_item_theta(nodelist):
     assert np.allclose(theta_observed, theta_expected)
 
 
+def test_item_theta_errors():
+    """Tests that item_theta rejects empty lists and missing items."""
+    with pytest.raises(ValueError):
+        item_theta([], 1)
+    with pytest.raises(ValueError, match="inside itemlist") as excinfo:
+        item_theta([1, 2], 3)
+    assert excinfo.value.__suppress_context__
+
+
 @given(floats(), floats())
 def test_get_cartesian(r, theta):
     """
@@ -68,3 +80,31 @@ def test_correct_negative_angle(angle):
     assert np.allclose(obs, exp)
     assert obs <= 2 * np.pi
     assert obs >= 0
+
+
+def test_correct_hive_angles():
+    """Test that hive angle corrections apply elementwise to arrays."""
+    start = np.array([4.0, 1.0, tau, 0.0, 1.0])
+    end = np.array([0.0, 0.0, 1.0, 4.0, 2.0])
+    start_obs, end_obs = correct_hive_angles(start, end)
+
+    assert np.allclose(start_obs, [4.0, 0.0, 0.0, tau, 1.0])
+    assert np.allclose(end_obs, [tau, 1.0, 1.0, 4.0, 2.0])
+
+
+def test_circles():
+    """Test that circles are centred on their points with the given radii."""
+    xy = np.array([[0.0, 0.0], [3.0, -1.0], [-2.0, 5.0]])
+    radius = np.array([1.0, 0.5, 2.0])
+    paths = circles(xy, radius)
+    assert len(paths) == len(xy)
+    for path, (x, y), r in zip(paths, xy, radius):
+        assert np.allclose(
+            path.get_extents().get_points(), [[x - r, y - r], [x + r, y + r]]
+        )
+
+    # A single radius is shared by all circles.
+    for path, (x, y) in zip(circles(xy, 2.0), xy):
+        assert np.allclose(
+            path.get_extents().get_points(), [[x - 2, y - 2], [x + 2, y + 2]]
+        )
@@ -106,16 +106,34 @@ def test_matrix(dummyG, group_by, sort_by):
 def test_geo(geoG, group_by=None, sort_by=None):
     """Test for geo layout.
 
-    Checks: None. This is just an execution test.
+    Checks:
+
+    1. Nodes are placed at their (longitude, latitude).
     """
     pos, nt = get_pos_df(geoG, layouts.geo, group_by=group_by, sort_by=sort_by)
+    assert np.allclose(pos.loc[nt.index, "x"], nt["longitude"])
+    assert np.allclose(pos.loc[nt.index, "y"], nt["latitude"])
 
 
 @pytest.mark.usefixtures("dummyG")
 @pytest.mark.parametrize("sort_by", ("value", None))
 def test_hive(dummyG, sort_by):
-    """Hive plot node layout execution test."""
+    """Hive plot node layout test.
+
+    Checks:
+
+    1. Each group's nodes lie along a single axis.
+    2. Nodes on an axis are spaced one radius unit apart,
+    starting from the inner radius.
+    """
     pos, nt = get_pos_df(dummyG, layouts.hive, group_by="group", sort_by=sort_by)
+    pos = pos.join(nt)
+    pos["r"] = np.hypot(pos["x"], pos["y"])
+    pos["theta"] = np.arctan2(pos["y"], pos["x"]).round(8)
+    for grp, df in pos.groupby("group"):
+        assert df["theta"].nunique() == 1
+        radii = np.sort(df["r"].to_numpy())
+        assert np.allclose(radii, 2 * (8 + np.arange(len(df))))
 
 
 @pytest.mark.usefixtures("manygroupG")
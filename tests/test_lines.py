@@ -0,0 +1,44 @@
+"""Tests for edge collection helpers."""
+
+import numpy as np
+import pytest
+from matplotlib.path import Path
+
+from nxviz.lines import edge_collection, edge_rgba, node_positions, polar_positions
+from nxviz.polcart import to_polar
+
+
+def test_node_positions():
+    """Test that node positions are returned in the order of the nodes asked for."""
+    pos = {"a": np.array([0.0, 1.0]), "b": np.array([2.0, 3.0]), 4: np.array([5, 6])}
+    xy = node_positions(pos, [4, "a", "a", "b"])
+    assert np.array_equal(xy, [[5, 6], [0, 1], [0, 1], [2, 3]])
+
+    with pytest.raises(KeyError):
+        node_positions(pos, ["a", "c"])
+
+
+def test_polar_positions():
+    """Test that polar_positions agrees with to_polar."""
+    xy = np.array([[1.0, 0.0], [0.0, 2.0], [-1.0, -1.0], [3.0, -4.0]])
+    r, theta = polar_positions(xy)
+    for (x, y), ri, ti in zip(xy, r, theta):
+        assert np.allclose((ri, ti), to_polar(x, y))
+
+
+def test_edge_rgba():
+    """Test that edge_rgba writes alpha into the alpha channel only."""
+    rgba = edge_rgba(["red", (0, 0, 1, 0.3)], [0.25, 1.0])
+    assert np.allclose(rgba, [[1, 0, 0, 0.25], [0, 0, 1, 1.0]])
+
+
+def test_edge_collection():
+    """Test that edge_collection styles each path by position."""
+    paths = [Path([[0, 0], [1, 1]]), Path([[1, 0], [0, 1]])]
+    collection = edge_collection(
+        paths, ["red", "blue"], [0.5, 1.0], [1.0, 3.0], {"zorder": 1}
+    )
+    assert len(collection.get_paths()) == 2
+    assert np.allclose(collection.get_edgecolors(), [[1, 0, 0, 0.5], [0, 0, 1, 1]])
+    assert np.allclose(collection.get_linewidths(), [1.0, 3.0])
+    assert collection.get_zorder() == 1
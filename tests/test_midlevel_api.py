@@ -1,6 +1,12 @@
 """Integration tests that operate at the mid-level API."""
 
-from nxviz import nodes, edges
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.colors import to_rgba_array
+
+from nxviz import edges, layouts, lines, nodes
+from nxviz.utils import edge_table, node_table
 import pytest
 
 
@@ -10,3 +16,165 @@ def test_hive_no_clone(dummyG):
     pos = nodes.hive(dummyG, group_by="group")
 
     edges.hive(dummyG, pos, pos_cloned=None)
+
+
+@pytest.mark.usefixtures("dummyG")
+def test_node_glyphs_in_data_limits(dummyG):
+    """Test that node glyphs are drawn as one collection within the axes limits."""
+    fig, ax = plt.subplots()
+    nodes.circos(dummyG, group_by="group", size_by="value")
+    assert len(ax.collections) == 1
+    glyphs = ax.collections[0]
+    assert len(glyphs.get_paths()) == len(dummyG)
+
+    xmin, xmax = ax.get_xlim()
+    ymin, ymax = ax.get_ylim()
+    for path in glyphs.get_paths():
+        (x0, y0), (x1, y1) = path.get_extents().get_points()
+        assert xmin <= x0 and x1 <= xmax
+        assert ymin <= y0 and y1 <= ymax
+    plt.close(fig)
+
+
+@pytest.mark.usefixtures("dummyG")
+def test_hive_cloned_nodes(dummyG):
+    """Test that cloned hive nodes are drawn in the same collection."""
+    fig, ax = plt.subplots()
+    pos, pos_cloned = nodes.hive(
+        dummyG, group_by="group", cloned_layout_kwargs={"rotation": 0.5}
+    )
+    assert set(pos) == set(pos_cloned) == set(dummyG.nodes())
+    assert len(ax.collections) == 1
+    assert len(ax.collections[0].get_paths()) == 2 * len(dummyG)
+
+    edges.hive(dummyG, pos, pos_cloned=pos_cloned)
+    plt.close(fig)
+
+
+@pytest.mark.usefixtures("dummyG")
+@pytest.mark.parametrize(
+    "node_func, edge_func",
+    [
+        (nodes.circos, edges.circos),
+        (nodes.arc, edges.arc),
+        (nodes.parallel, edges.line),
+    ],
+)
+def test_edges_as_one_collection(dummyG, node_func, edge_func):
+    """Test that edges are drawn as one collection with one path per edge."""
+    fig, ax = plt.subplots()
+    pos = node_func(dummyG, group_by="group")
+    edge_func(dummyG, pos)
+    assert len(ax.collections) == 2
+    edge_lines = ax.collections[1]
+    n_edges = len(dummyG.edges()) * (1 if dummyG.is_directed() else 2)
+    assert len(edge_lines.get_paths()) == n_edges
+    assert len(edge_lines.get_edgecolors()) == n_edges
+    plt.close(fig)
+
+
+@pytest.mark.usefixtures("dummyG")
+def test_edge_colors_carry_transparency(dummyG):
+    """Test that edge transparencies are baked into the edge RGBA array."""
+    fig, ax = plt.subplots()
+    pos = nodes.circos(dummyG)
+    edges.circos(dummyG, pos, color_by="edge_value", alpha_by="edge_value")
+    rgba = ax.collections[1].get_edgecolors()
+    n_edges = len(dummyG.edges()) * (1 if dummyG.is_directed() else 2)
+    assert rgba.shape == (n_edges, 4)
+    assert rgba[:, 3].min() < rgba[:, 3].max() <= 1.0
+    plt.close(fig)
+
+
+@pytest.mark.usefixtures("dummyG")
+def test_zero_size_nodes_not_drawn(dummyG):
+    """Test that nodes with zero size get no glyph."""
+    G = dummyG.copy()
+    hidden = list(G.nodes())[:3]
+    for n in G.nodes():
+        G.nodes[n]["size"] = 0 if n in hidden else 1
+    fig, ax = plt.subplots()
+    nodes.circos(G, size_by="size")
+    assert len(ax.collections[0].get_paths()) == len(G) - len(hidden)
+    plt.close(fig)
+
+
+@pytest.mark.usefixtures("dummyG")
+def test_aesthetics_series_matched_by_label(dummyG):
+    """Test that Series aesthetics are matched to nodes and edges by label."""
+    nt = node_table(dummyG)
+    et = edge_table(dummyG)
+    pos = layouts.circos(nt)
+    node_color = pd.Series(
+        ["red" if i % 2 else "blue" for i in range(len(nt))], index=nt.index
+    )
+    glyphs = nodes.node_glyphs(
+        nt, pos, node_color[::-1], 1.0, node_color[::-1] == "red"
+    )
+    visible = (node_color == "red").to_numpy()
+    assert np.array_equal(glyphs.get_facecolors(), to_rgba_array(node_color[visible]))
+
+    lw = pd.Series(np.arange(len(et), dtype=float), index=et.index)
+    edge_lines = lines.line(
+        et, pos, ["black"] * len(et), lw[::-1] / len(et), lw[::-1], {}
+    )
+    assert np.array_equal(edge_lines.get_linewidths(), lw.to_numpy())
+    assert np.array_equal(edge_lines.get_edgecolors()[:, 3], lw.to_numpy() / len(et))
+
+
+@pytest.mark.usefixtures("dummyG")
+def test_node_aesthetics(dummyG):
+    """Test that node_aesthetics returns scalars or scaled arrays per encoding."""
+    nt = node_table(dummyG)
+    aes = nodes.node_aesthetics(nt, None, None, None, alpha_scale=0.5, size_scale=2)
+    assert aes["color"].shape == (len(nt), 4)
+    assert aes["alpha"] == 0.5
+    assert aes["size"] == 2
+
+    aes = nodes.node_aesthetics(
+        nt,
+        "group",
+        "value",
+        "value",
+        alpha_bounds=(0, 2 * nt["value"].max()),
+        alpha_scale=0.5,
+        size_scale=2,
+    )
+    assert aes["color"].shape == (len(nt), 4)
+    assert np.allclose(aes["alpha"], nt["value"] / (2 * nt["value"].max()) * 0.5)
+    assert np.allclose(aes["size"], np.sqrt(nt["value"]) * 2)
+
+
+@pytest.mark.usefixtures("dummyG")
+def test_matrix_edgecolor_follows_alpha(dummyG):
+    """Test that a user edgecolor on matrix edges is faded by the edge alphas."""
+    fig, ax = plt.subplots()
+    pos = nodes.matrix(dummyG)
+    pos_cloned = nodes.matrix(dummyG, layout_kwargs={"axis": "y"})
+    edges.matrix(
+        dummyG,
+        pos,
+        pos_cloned=pos_cloned,
+        alpha_by="edge_value",
+        encodings_kwargs={"edgecolor": "black"},
+    )
+    edge_glyphs = ax.collections[-1]
+    facecolors = edge_glyphs.get_facecolors()
+    edgecolors = edge_glyphs.get_edgecolors()
+    assert np.array_equal(edgecolors[:, :3], np.zeros((len(edgecolors), 3)))
+    assert np.array_equal(edgecolors[:, 3], facecolors[:, 3])
+    assert edgecolors[:, 3].min() < edgecolors[:, 3].max()
+    plt.close(fig)
+
+
+@pytest.mark.usefixtures("dummyG")
+def test_node_edgecolor_follows_alpha(dummyG):
+    """Test that a user edgecolor on node glyphs is faded by the node alphas."""
+    fig, ax = plt.subplots()
+    nodes.circos(dummyG, alpha_by="value", encodings_kwargs={"edgecolor": "black"})
+    glyphs = ax.collections[0]
+    alpha = nodes.transparency(node_table(dummyG), "value").to_numpy()
+    assert np.array_equal(glyphs.get_facecolors()[:, 3], alpha)
+    assert np.array_equal(glyphs.get_edgecolors()[:, 3], alpha)
+    assert np.array_equal(glyphs.get_edgecolors()[:, :3], np.zeros((len(alpha), 3)))
+    plt.close(fig)
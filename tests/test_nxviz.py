@@ -32,4 +32,18 @@ def test_classes(dummyG):
     objects = nv.ArcPlot, nv.CircosPlot, nv.MatrixPlot, nv.HivePlot
     for obj in objects:
         fig, ax = plt.subplots()
-        obj(dummyG, node_grouping="group", node_order="value", node_color="group")
+        plot = obj(
+            dummyG, node_grouping="group", node_order="value", node_color="group"
+        )
+        assert plot.ax is not None
+
+
+def test_classes_draw_on_given_axes(dummyG):
+    """Tests that the object oriented APIs draw on a given axes object."""
+    fig, ax = plt.subplots()
+    n_figures = len(plt.get_fignums())
+    plot = nv.CircosPlot(dummyG, ax=ax, node_grouping="group")
+    assert plot.ax is ax
+    assert plot.fig is fig
+    assert len(plt.get_fignums()) == n_figures
+    plt.close(fig)
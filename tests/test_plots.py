@@ -11,12 +11,21 @@ the following issue:
 
 from random import random
 from matplotlib import pyplot as plt
+from matplotlib.collections import PathCollection
 
 import networkx as nx
-
+import numpy as np
 
 # from nxviz import ArcPlot, CircosPlot, GeoPlot, MatrixPlot
-from nxviz.plots import despine, respine, rescale, rescale_arc, rescale_square
+from nxviz.geometry import circles
+from nxviz.plots import (
+    despine,
+    relim,
+    respine,
+    rescale,
+    rescale_arc,
+    rescale_square,
+)
 
 # from matplotlib.testing.decorators import _image_directories
 
@@ -56,6 +65,18 @@ def test_respine():
         assert ax.spines[spine].get_visible()
 
 
+def test_relim():
+    """Test that relim includes the data limits of collections."""
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [0, 1])
+    ax.add_collection(PathCollection(circles(np.array([[5.0, -3.0]]), 1.0)))
+    relim(ax)
+    (x0, y0), (x1, y1) = ax.dataLim.get_points()
+    assert x0 == 0 and y0 == -4
+    assert x1 == 6 and y1 == 1
+    plt.close(fig)
+
+
 # def test_circos_plot():
 #     c = CircosPlot(G)  # noqa: F841
 #     diff = diff_plots(c, "circos.png", baseline_dir, result_dir)
@@ -5,6 +5,7 @@ import pytest
 import os
 
 import matplotlib.pyplot as plt
+import numpy as np
 
 from matplotlib.testing.compare import compare_images
 
@@ -13,6 +14,7 @@ from nxviz.utils import (
     is_data_diverging,
     is_data_homogenous,
     is_groupable,
+    nonzero_sign,
     num_discrete_groups,
 )
 
@@ -71,6 +73,14 @@ def test_num_discrete_groups():
     assert num_discrete_groups(ordinal) == 5
 
 
+def test_nonzero_sign():
+    """Test that nonzero_sign never returns 0, for scalars and arrays."""
+    assert nonzero_sign(-2.5) == -1
+    assert nonzero_sign(0) == 1
+    assert nonzero_sign(3) == 1
+    assert np.array_equal(nonzero_sign(np.array([-1.0, 0.0, 2.0])), [-1, 1, 1])
+
+
 def test_binomial():
     """Test for is_data_type for binomial data."""
     assert infer_data_type(binomial) == "categorical"